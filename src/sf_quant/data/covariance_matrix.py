@@ -1,10 +1,14 @@
 import datetime as dt
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import numpy as np
 import polars as pl
 from .exposures import load_exposures_by_date
 from .covariances import load_covariances_by_date
 from .assets import load_assets_by_date
 from ._factors import factors
+from ._tables import assets_table, covariances_table, exposures_table
 
 
 def construct_factor_model_components(
@@ -20,23 +24,24 @@ def construct_factor_model_components(
         - factor_covariance: shape (K, K), in decimal space
         - specific_risk: shape (N,), variance in decimal space
     """
-    exposures = _construct_factor_exposure_matrix(date_, barrids).drop("barrid").to_numpy()
-    
-    factor_cov = _construct_factor_covariance_matrix(date_).drop("factor_1").to_numpy()
-    factor_cov = factor_cov / 100**2
-
-    barrids_df = pl.DataFrame({"barrid": barrids})
-    sr_df = load_assets_by_date(
-        date_, in_universe=False, columns=["date", "barrid", "specific_risk"]
+    exposures = (
+        _construct_factor_exposure_matrix(date_, barrids)
+        .drop("barrid")
+        .rechunk()
+        .to_numpy(order="fortran")
     )
-    sr_df = barrids_df.join(sr_df, on=["barrid"], how="left").fill_null(0)
     
-    specific_risk = np.power(sr_df["specific_risk"].to_numpy(), 2) / 100**2
+    factor_cov = _construct_factor_covariance_matrix(date_) / 100**2
+
+    specific_risk = _construct_specific_risk_vector(date_, barrids)
+    specific_risk = specific_risk * specific_risk / 100**2
 
     return exposures, factor_cov, specific_risk
 
 
-def construct_covariance_matrix(date_: dt.date, barrids: list[str]) -> pl.DataFrame:
+def construct_covariance_matrix(
+    date_: dt.date, barrids: list[str], dtype: np.dtype = np.float64
+) -> pl.DataFrame:
     """
     Construct the asset covariance matrix from a factor model.
 
@@ -51,6 +56,10 @@ def construct_covariance_matrix(date_: dt.date, barrids: list[str]) -> pl.DataFr
         The date for which the covariance matrix is computed.
     barrids : list of str
         List of Barrid identifiers for the assets.
+    dtype : numpy.dtype, optional
+        Floating point precision used to build the matrix. Defaults to
+        ``np.float64``. ``np.float32`` halves memory traffic for large
+        universes at the cost of precision.
 
     Returns
     -------
@@ -62,11 +71,19 @@ def construct_covariance_matrix(date_: dt.date, barrids: list[str]) -> pl.DataFr
         - Each subsequent column corresponds to the covariance of
           the row asset with the column asset.
 
+    Raises
+    ------
+    ValueError
+        If no factor exposures or factor covariances exist for ``date_``.
+
     Notes
     -----
     The input factor covariance matrix is assumed to be positive
     semidefinite (PSD).
 
+    Rows and columns follow the order of ``barrids``. Assets with no
+    exposures or specific risk on ``date_`` are filled with zeros.
+
     Examples
     --------
     >>> import sf_quant.data as sfd
@@ -88,103 +105,343 @@ def construct_covariance_matrix(date_: dt.date, barrids: list[str]) -> pl.DataFr
     │ USA0771 ┆ 697.641425  ┆ 11158.366868 │
     └─────────┴─────────────┴──────────────┘
     """
-    # Load
-    exposures_matrix = (
-        _construct_factor_exposure_matrix(date_, barrids).drop("barrid").to_numpy()
-    )
-    covariance_matrix = (
-        _construct_factor_covariance_matrix(date_).drop("factor_1").to_numpy()
-    )
-    idio_risk_matrix = (
-        _construct_specific_risk_matrix(date_, barrids).drop("barrid").to_numpy()
+    covariance_matrix, barrids = construct_covariance_matrix_array(
+        date_, barrids, dtype
     )
 
+    # Package
+    covariance_matrix = _to_labeled_frame(covariance_matrix, "barrid", barrids)
+
+    return covariance_matrix
+
+
+def construct_covariance_matrix_array(
+    date_: dt.date, barrids: list[str], dtype: np.dtype = np.float64
+) -> tuple[np.ndarray, list[str]]:
+    """
+    Construct the asset covariance matrix from a factor model as a NumPy array.
+
+    Same as :func:`construct_covariance_matrix`, but returns the raw
+    matrix instead of a labeled Polars DataFrame. Use this when the
+    matrix is passed straight to a solver, to avoid packaging it into a
+    DataFrame and converting it back.
+
+    Parameters
+    ----------
+    date_ : datetime.date
+        The date for which the covariance matrix is computed.
+    barrids : list of str
+        List of Barrid identifiers for the assets.
+    dtype : numpy.dtype, optional
+        Floating point precision used to build the matrix. Defaults to
+        ``np.float64``.
+
+    Returns
+    -------
+    tuple of (np.ndarray, list of str)
+        - covariance_matrix: shape (N, N), in decimal space
+        - barrids: the asset identifiers labeling its rows and columns
+
+    Raises
+    ------
+    ValueError
+        If no factor exposures or factor covariances exist for ``date_``.
+
+    Examples
+    --------
+    >>> import sf_quant.data as sfd
+    >>> import datetime as dt
+    >>> date_ = dt.date(2024, 1, 3)
+    >>> barrids = ['USA06Z1', 'USA0771']
+    >>> covariance_matrix, barrids = sfd.construct_covariance_matrix_array(
+    ...     date_=date_,
+    ...     barrids=barrids
+    ... )
+    >>> covariance_matrix
+    array([[ 3224.338938,   697.641425],
+           [  697.641425, 11158.366868]])
+    """
+    # Load
+    exposures_matrix = _construct_factor_exposure_matrix(date_, barrids)
+    covariance_matrix = _construct_factor_covariance_matrix(date_)
+    specific_risk = _construct_specific_risk_vector(date_, barrids)
+
     # Compute covariance matrix
-    covariance_matrix = (
-        exposures_matrix @ covariance_matrix @ exposures_matrix.T + idio_risk_matrix
+    covariance_matrix = _assemble_covariance_matrix(
+        exposures_matrix, covariance_matrix, specific_risk, dtype
     )
 
-    # Put in decimal space
-    covariance_matrix /= 100**2
+    return covariance_matrix, list(barrids)
 
-    # Package
-    covariance_matrix = pl.DataFrame(
-        {
-            "barrid": barrids,
-            **{id: covariance_matrix[:, i] for i, id in enumerate(barrids)},
-        }
+
+def construct_covariance_matrices(
+    dates: list[dt.date],
+    barrids: list[str],
+    dtype: np.dtype = np.float64,
+    n_cpus: int | None = None,
+    chunk_size: int = 63,
+) -> dict[dt.date, pl.DataFrame]:
+    """
+    Construct asset covariance matrices from a factor model for many dates.
+
+    This is the batch form of :func:`construct_covariance_matrix`. Dates are
+    processed in chunks: exposures, factor covariances, and specific risks
+    for each chunk are loaded with a single scan per dataset, and the
+    covariance matrices are then built from the preloaded data in parallel
+    across dates using a thread pool.
+
+    Parameters
+    ----------
+    dates : list of datetime.date
+        The dates for which covariance matrices are computed.
+    barrids : list of str
+        List of Barrid identifiers for the assets.
+    dtype : numpy.dtype, optional
+        Floating point precision used to build the matrices. Defaults to
+        ``np.float64``.
+    n_cpus : int, optional
+        Number of threads used to build the matrices. Defaults to half of
+        the available CPUs, leaving room for BLAS threads.
+    chunk_size : int, optional
+        Number of dates whose inputs are loaded at once. Defaults to 63,
+        about a quarter of trading days.
+
+    Returns
+    -------
+    dict of datetime.date to pl.DataFrame
+        A mapping from each date to its covariance matrix, in the same
+        format as returned by :func:`construct_covariance_matrix`.
+
+    Raises
+    ------
+    ValueError
+        If any of ``dates`` has no exposures, factor covariances, or
+        specific risks.
+
+    Notes
+    -----
+    Every matrix in the result is held in memory at once, which takes
+    ``8 * N**2`` bytes per date for ``float64`` (about 72 MB at
+    N = 3000). For backtest-length date lists, call this over shorter
+    ranges of dates and release each result before the next, or use
+    ``dtype=np.float32`` to halve the footprint.
+
+    Examples
+    --------
+    >>> import sf_quant.data as sfd
+    >>> import datetime as dt
+    >>> dates = [dt.date(2024, 1, 2), dt.date(2024, 1, 3)]
+    >>> barrids = ['USA06Z1', 'USA0771']
+    >>> covariance_matrices = sfd.construct_covariance_matrices(
+    ...     dates=dates,
+    ...     barrids=barrids
+    ... )
+    >>> covariance_matrices[dt.date(2024, 1, 3)]
+    shape: (2, 3)
+    ┌─────────┬─────────────┬──────────────┐
+    │ barrid  ┆ USA06Z1     ┆ USA0771      │
+    │ ---     ┆ ---         ┆ ---          │
+    │ str     ┆ f64         ┆ f64          │
+    ╞═════════╪═════════════╪══════════════╡
+    │ USA06Z1 ┆ 3224.338938 ┆ 697.641425   │
+    │ USA0771 ┆ 697.641425  ┆ 11158.366868 │
+    └─────────┴─────────────┴──────────────┘
+    """
+    def construct(date_: dt.date) -> pl.DataFrame:
+        exposures_matrix = _align_factor_exposures(exposures[date_], barrids, date_)
+        covariance_matrix = _symmetrize_factor_covariance(covariances[date_], date_)
+        specific_risk = _align_specific_risk(specific_risks[date_], barrids)
+
+        # Compute covariance matrix
+        covariance_matrix = _assemble_covariance_matrix(
+            exposures_matrix, covariance_matrix, specific_risk, dtype
+        )
+
+        # Package
+        return _to_labeled_frame(covariance_matrix, "barrid", barrids)
+
+    # Dates are independent and BLAS/Polars release the GIL
+    n_cpus = n_cpus or max(1, (os.cpu_count() or 1) // 2)
+    n_cpus = max(1, min(len(dates), n_cpus))
+
+    covariance_matrices = {}
+    with ThreadPoolExecutor(max_workers=n_cpus) as executor:
+        # Only one chunk of inputs is held in memory at a time
+        for start in range(0, len(dates), chunk_size):
+            chunk = dates[start : start + chunk_size]
+
+            # Load
+            exposures = _partition_by_date(exposures_table.scan(), chunk, "exposures")
+            covariances = _partition_by_date(
+                covariances_table.scan(), chunk, "covariances"
+            )
+            specific_risks = _partition_by_date(
+                assets_table.scan().select("date", "barrid", "specific_risk"),
+                chunk,
+                "specific risks",
+            )
+
+            covariance_matrices.update(zip(chunk, executor.map(construct, chunk)))
+
+    return covariance_matrices
+
+
+def _partition_by_date(
+    lf: pl.LazyFrame, dates: list[dt.date], name: str
+) -> dict[dt.date, pl.DataFrame]:
+    df = lf.filter(pl.col("date").is_in(dates)).collect()
+    partitions = {
+        key[0]: partition
+        for key, partition in df.partition_by("date", as_dict=True).items()
+    }
+
+    # An empty partition would become an all-zero covariance matrix
+    missing = [date_ for date_ in dates if date_ not in partitions]
+    if missing:
+        raise ValueError(
+            f"No {name} found for dates: {', '.join(map(str, missing))}."
+        )
+
+    return {date_: partitions[date_] for date_ in dates}
+
+
+def _assemble_covariance_matrix(
+    exposures: pl.DataFrame,
+    factor_cov: np.ndarray,
+    specific_risk: np.ndarray,
+    dtype: np.dtype,
+) -> np.ndarray:
+    exposures_matrix = (
+        exposures.drop("barrid")
+        .rechunk()
+        .to_numpy(order="fortran", writable=False)
+        .astype(dtype, copy=False)
     )
+    factor_cov = factor_cov.astype(dtype, copy=False)
+    specific_risk = specific_risk.astype(dtype, copy=False)
+
+    covariance_matrix = _factor_covariance_product(exposures_matrix, factor_cov)
+
+    # Add specific variance along the diagonal
+    idx = np.arange(covariance_matrix.shape[0])
+    covariance_matrix[idx, idx] += specific_risk * specific_risk
+
+    # Put in decimal space
+    covariance_matrix /= 100**2
 
     return covariance_matrix
 
 
+def _factor_covariance_product(
+    exposures: np.ndarray, factor_cov: np.ndarray
+) -> np.ndarray:
+    # (B F) B^T keeps the small (N, K) product first
+    return (exposures @ factor_cov) @ exposures.T
+
+
+def _to_labeled_frame(
+    matrix: np.ndarray, index_name: str, labels: list[str]
+) -> pl.DataFrame:
+    # Fortran order keeps each column contiguous so Polars copies it in bulk
+    frame = pl.from_numpy(np.asfortranarray(matrix), schema=labels, orient="row")
+
+    return frame.insert_column(0, pl.Series(index_name, labels))
+
+
+@lru_cache(maxsize=8)
+def _barrids_frame(barrids: tuple[str, ...]) -> pl.DataFrame:
+    # Reused across dates when backtests hold the universe fixed
+    return pl.DataFrame({"barrid": barrids})
+
+
 def _construct_factor_exposure_matrix(
     date_: dt.date, barrids: list[str]
 ) -> pl.DataFrame:
+    return _align_factor_exposures(load_exposures_by_date(date_), barrids, date_)
+
+
+def _align_factor_exposures(
+    exposures: pl.DataFrame, barrids: list[str], date_: dt.date
+) -> pl.DataFrame:
+    # Zero-filling every asset would silently report zero factor risk
+    if exposures.is_empty():
+        raise ValueError(f"No factor exposures found for {date_}.")
+
+    # Barrids
+    barrids_df = _barrids_frame(tuple(barrids))
+
+    # Align rows with the requested barrids
     exp_mat = (
-        load_exposures_by_date(date_)
-        .drop("date")
-        .filter(pl.col("barrid").is_in(barrids))
+        barrids_df.join(
+            exposures.drop("date"),
+            on="barrid",
+            how="left",
+            maintain_order="left",
+        )
         .fill_null(0)
-        .sort("barrid")
         .select(["barrid"] + factors)
     )
 
     return exp_mat
 
 
-def _construct_factor_covariance_matrix(date_: dt.date) -> pl.DataFrame:
-    # Load
-    fc_df = load_covariances_by_date(date_).drop("date")
+def _construct_factor_covariance_matrix(date_: dt.date) -> np.ndarray:
+    # Key on the table location too so that sfd.env() changes bypass the cache
+    return _cached_factor_covariance_matrix(date_, covariances_table._base_path)
 
-    # Sort headers and columns
-    fc_df = fc_df.select(["factor_1"] + factors)
 
-    fc_df = fc_df.filter(pl.col('factor_1').is_in(factors))
+@lru_cache(maxsize=512)
+def _cached_factor_covariance_matrix(date_: dt.date, base_path: str) -> np.ndarray:
+    cov_mat = _symmetrize_factor_covariance(load_covariances_by_date(date_), date_)
 
-    fc_df = fc_df.sort("factor_1")
+    # Shared between callers, so guard against in-place edits
+    cov_mat.flags.writeable = False
 
-    # Convert from upper triangular to symetric
-    utm = fc_df.drop("factor_1").to_numpy()
-    cov_mat = np.where(np.isnan(utm), utm.T, utm)
+    return cov_mat
 
-    # Package
-    cov_mat = pl.DataFrame(
-        {
-            "factor_1": factors,
-            **{col: cov_mat[:, idx] for idx, col in enumerate(factors)},
-        }
-    )
 
-    # Fill NaN (from Barra)
-    cov_mat = cov_mat.fill_nan(0)
+def _symmetrize_factor_covariance(fc_df: pl.DataFrame, date_: dt.date) -> np.ndarray:
+    # Zero-filling every factor would silently report zero factor risk
+    if fc_df.is_empty():
+        raise ValueError(f"No factor covariances found for {date_}.")
 
-    return cov_mat
+    fc_df = fc_df.drop("date")
 
+    # Order rows to match the (already sorted) factor columns
+    fc_df = pl.DataFrame({"factor_1": factors}).join(
+        fc_df.select(["factor_1"] + factors),
+        on="factor_1",
+        how="left",
+        maintain_order="left",
+    )
 
-def _construct_specific_risk_matrix(date_: dt.date, barrids: list[str]) -> pl.DataFrame:
-    # Barrids
-    barrids_df = pl.DataFrame({"barrid": barrids})
+    # Convert from triangular to symetric; after sorting, each pair may sit on
+    # either side of the diagonal, so fill every NaN from its mirror
+    cov_mat = fc_df.drop("factor_1").to_numpy()
+    cov_mat = np.where(np.isnan(cov_mat), cov_mat.T, cov_mat)
 
+    # Fill NaN (from Barra)
+    return np.nan_to_num(cov_mat, copy=False, nan=0.0)
+
+
+def _construct_specific_risk_vector(date_: dt.date, barrids: list[str]) -> np.ndarray:
     # Load
     sr_df = load_assets_by_date(
         date_, in_universe=False, columns=["date", "barrid", "specific_risk"]
     )
 
+    return _align_specific_risk(sr_df, barrids)
+
+
+def _align_specific_risk(sr_df: pl.DataFrame, barrids: list[str]) -> np.ndarray:
+    # Barrids
+    barrids_df = _barrids_frame(tuple(barrids))
+
     # Filter
-    sr_df = barrids_df.join(sr_df, on=["barrid"], how="left").fill_null(
+    sr_df = barrids_df.join(
+        sr_df, on=["barrid"], how="left", maintain_order="left"
+    ).fill_null(
         0
     )  # ask Brandon about this.
 
-    # Convert vector to diagonal matrix
-    diagonal = np.power(np.diag(sr_df["specific_risk"]), 2)
-
-    # Package
-    risk_matrix = pl.DataFrame(
-        {
-            "barrid": barrids,
-            **{id: diagonal[:, i] for i, id in enumerate(barrids)},
-        }
-    )
-
-    return risk_matrix
+    return sr_df["specific_risk"].to_numpy()
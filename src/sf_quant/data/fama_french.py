@@ -1,7 +1,9 @@
 import datetime as dt
+from functools import lru_cache
 
 import polars as pl
 
+from ._tables import ff_table
 from ._views import fama_french
 from ..schema import FamaFrenchSchema
 
@@ -26,6 +28,13 @@ def load_fama_french(start: dt.date, end: dt.date) -> pl.DataFrame:
         A DataFrame containing Fama-French factor data between the specified dates,
         with columns: date, mkt_rf, smb, hml, rmw, cma, rf.
 
+    Notes
+    -----
+    Results are cached by date range, so repeated calls (e.g. across
+    regressions in a research session) skip the read and validation.
+    Each call returns its own copy, so modifying it does not affect
+    later calls.
+
     Examples
     --------
     >>> import sf_quant.data as sfd
@@ -43,6 +52,13 @@ def load_fama_french(start: dt.date, end: dt.date) -> pl.DataFrame:
     │ 2024-01-02 ┆ 0.0123 ┆ 0.0045 ┆ -0.002 ┆ 0.0010 ┆ 0.0008 ┆ 0.0001 │
     └────────────┴────────┴────────┴────────┴────────┴────────┴────────┘
     """
+    # Callers get their own frame so in-place edits never reach the cache
+    return _cached_fama_french(start, end, ff_table._base_path).clone()
+
+
+@lru_cache(maxsize=32)
+def _cached_fama_french(start: dt.date, end: dt.date, base_path: str) -> pl.DataFrame:
+    # base_path keys the cache on the configured database as well as the dates
     result = fama_french().filter(pl.col("date").is_between(start, end)).collect()
     return FamaFrenchSchema.validate(result)
 
@@ -25,6 +25,7 @@ from .ics import (
     generate_alpha_ics,
 )
 from .turnover import (
+    generate_turnover_from_weights,
     get_turnover_stats,
     plot_turnover,
 )
@@ -51,6 +52,7 @@ __all__ = [
     "generate_alpha_ics",
     "generate_ic_chart",
     # Turnover
+    "generate_turnover_from_weights",
     "get_turnover_stats",
     "plot_turnover",
 ]
@@ -51,28 +51,20 @@ def generate_returns_chart(
     -----
     - Cumulative returns are computed as the compounded product of daily returns.
     - Returns are expressed in percentages for visualization.
-    - If ``log_scale=True``, both daily and cumulative returns are transformed
-      using the natural log (``log1p``).
+    - If ``log_scale=True``, cumulative returns are transformed using the
+      natural log (``log1p``).
     """
-    returns_wide = (
-        returns.sort("date")
-        .with_columns(
-            pl.col("return")
-            .add(1)
-            .cum_prod()
-            .sub(1)
-            .alias("cumulative_return")
-        )
-    )
-
     if log_scale:
-        returns_wide = returns_wide.with_columns(
-            pl.col("return", "cumulative_return").log1p()
-        )
+        # log(prod(1 + r)) == sum(log1p(r))
+        cumulative_return = pl.col("return").log1p().cum_sum()
+    else:
+        cumulative_return = pl.col("return").add(1).cum_prod().sub(1)
 
-    # Put into percent space
-    returns_wide = returns_wide.with_columns(
-        pl.col("return", "cumulative_return").mul(100)
+    # Keep only the plotted columns for Seaborn's pandas conversion
+    returns_wide = returns.sort("date").select(
+        "date",
+        # Put into percent space
+        cumulative_return.mul(100).alias("cumulative_return"),
     )
 
     plt.figure(figsize=(10, 6))
@@ -143,30 +135,21 @@ def generate_multi_returns_chart(
     - Cumulative returns are computed as the compounded product of daily
       returns for each portfolio.
     - Returns are expressed in percentages for visualization.
-    - If ``log_scale=True``, both daily and cumulative returns are transformed
-      using the natural log (``log1p``).
+    - If ``log_scale=True``, cumulative returns are transformed using the
+      natural log (``log1p``).
     """
-    returns_wide = (
-        returns.sort("date", "portfolio")
-        .with_columns(
-            pl.col("return")
-            .add(1)
-            .cum_prod()
-            .sub(1)
-            .over("portfolio")
-            .alias("cumulative_return")
-        )
-        .with_columns(pl.col("portfolio").str.to_titlecase().alias("label"))
-    )
-
     if log_scale:
-        returns_wide = returns_wide.with_columns(
-            pl.col("return", "cumulative_return").log1p()
-        )
-
-    # Put into percent space
-    returns_wide = returns_wide.with_columns(
-        pl.col("return", "cumulative_return").mul(100)
+        # log(prod(1 + r)) == sum(log1p(r))
+        cumulative_return = pl.col("return").log1p().cum_sum()
+    else:
+        cumulative_return = pl.col("return").add(1).cum_prod().sub(1)
+
+    # Keep only the plotted columns for Seaborn's pandas conversion
+    returns_wide = returns.sort("date", "portfolio").select(
+        "date",
+        # Put into percent space
+        cumulative_return.mul(100).over("portfolio").alias("cumulative_return"),
+        pl.col("portfolio").str.to_titlecase().alias("label"),
     )
 
     plt.figure(figsize=(10, 6))
@@ -231,7 +214,7 @@ def generate_leverage_chart(
     - Leverage > 1.0 indicates use of margin or shorting.
     - Leverage is expressed as a ratio (not percentage).
     """
-    leverage_wide = leverage.sort("date")
+    leverage_wide = leverage.sort("date").select("date", "leverage")
 
     plt.figure(figsize=(10, 6))
 
@@ -291,7 +274,7 @@ def generate_drawdown_chart(
     """
     drawdowns_wide = (
         drawdowns.sort("date")
-        .with_columns(pl.col("drawdown").mul(100))
+        .select("date", pl.col("drawdown").mul(100))
     )
 
     plt.figure(figsize=(10, 6))
@@ -361,8 +344,9 @@ def generate_ic_chart(
     ics = (
         ics
         .sort("date")
-        .with_columns(
-            pl.col("ic").fill_null(0).cum_sum().alias("cumulative_ic")
+        .select(
+            "date",
+            pl.col("ic").fill_null(0).cum_sum().alias("cumulative_ic"),
         )
     )
 
@@ -3,10 +3,11 @@ from sf_quant.schema import AlphaSchema, SecurityRetSchema
 import dataframely as dy
 
 def generate_alpha_ics(
-    alphas: dy.DataFrame[AlphaSchema],
-    rets:   dy.DataFrame[SecurityRetSchema],
+    alphas: dy.DataFrame[AlphaSchema] | dy.LazyFrame[AlphaSchema],
+    rets:   dy.DataFrame[SecurityRetSchema] | dy.LazyFrame[SecurityRetSchema],
     method: str = "rank",      # "pearson" or "rank"
-    window: int = 22
+    window: int = 22,
+    tie_method: str = "average",   # "average" or "ordinal"
     ) -> pl.DataFrame:
     """
     Compute Information Coefficients (ICs) between previous-day alpha and realized returns.
@@ -18,8 +19,8 @@ def generate_alpha_ics(
 
     Parameters
     ----------
-    alphas : pl.DataFrame
-        A Polars DataFrame containing alpha signals.
+    alphas : pl.DataFrame or pl.LazyFrame
+        A Polars DataFrame (or LazyFrame) containing alpha signals.
         Must include the following columns:
 
         - ``date`` (date): The observation date of the alpha.
@@ -27,8 +28,8 @@ def generate_alpha_ics(
         - ``alpha`` (float): Alpha value for the asset on the given date.
 
         Must be validated against the ``AlphaSchema`` before calling this function.
-    rets : pl.DataFrame
-        A Polars DataFrame containing realized returns. Should
+    rets : pl.DataFrame or pl.LazyFrame
+        A Polars DataFrame (or LazyFrame) containing realized returns. Should
         include returns for at least [window] days after the end of the alpha period.
         Must include the following columns:
 
@@ -41,6 +42,11 @@ def generate_alpha_ics(
         ``"rank"``.
     window : int, optional
         Number of days to compute rolling returns over. Defaults to 22.
+    tie_method : str, optional
+        How ties are ranked when ``method="rank"``. ``"average"`` assigns tied
+        values their mean rank; ``"ordinal"`` assigns distinct integer ranks
+        in order of appearance, which is cheaper but only well defined for
+        signals without ties. Defaults to ``"average"``.
 
     Returns
     -------
@@ -56,8 +62,14 @@ def generate_alpha_ics(
     - The function first shifts alpha values by one day per asset to align with
       the next day's realized return.
     - Observations with null or non-finite alpha or return values are excluded.
+    - Alphas and window returns are compared in single precision (``Float32``);
+      the returned ICs are ``Float64``.
     - Spearman IC is computed by ranking alpha and return values within each date
-      and then calculating the Pearson correlation of ranks.
+      and then calculating the Pearson correlation of ranks, evaluated in closed
+      form from sums of squared ranks and rank differences.
+    - The whole pipeline is built as a single lazy query and collected once
+      with Polars' streaming engine, so lazy inputs (e.g. from ``scan_parquet``)
+      are processed in batches rather than materialized in full.
     - Users should validate that input DataFrames conform to the expected schema
       to avoid runtime errors.
 
@@ -94,15 +106,22 @@ def generate_alpha_ics(
     │ 2024-01-04 ┆ -1.0     ┆ 1   │
     └────────────┴──────────┴─────┘
     """
-    # Lag alpha by security
+    m = method.lower()
+    if m not in {"pearson", "rank"}:
+        raise ValueError("method must be 'pearson' or 'rank'")
+    if tie_method not in {"average", "ordinal"}:
+        raise ValueError("tie_method must be 'average' or 'ordinal'")
+
+    # Build a single lazy plan so projections and filters push through the join
     alphas = (
-        alphas
-        .sort(["barrid", "date"])
+        alphas.lazy()
         .select("date", "barrid", "alpha")
+        # is_finite is null for null inputs, which the filter drops
+        .filter(pl.col("alpha").is_finite())
     )
 
     rets = (
-        rets
+        rets.lazy()
         .select("date", "barrid", "return")
         .sort(["barrid", "date"])
         .with_columns(
@@ -111,40 +130,42 @@ def generate_alpha_ics(
             .exp().sub(1).shift(-window + 1)
             .alias("window_return")
             )
+        .select("date", "barrid", "window_return")
+        # Filter after the rolling sum so windows still span every return
+        .filter(pl.col("window_return").is_finite())
     )
 
-    # Join with returns
-    df = (
-        alphas.join(rets.select("date", "barrid", "window_return"), on=["date", "barrid"], how="inner")
-             .filter(pl.col("alpha").is_not_null()
-                     & pl.col("alpha").is_finite()
-                     & pl.col("window_return").is_not_null()
-                     & pl.col("window_return").is_finite())
-    )
-
-    m = method.lower()
-    if m not in {"pearson", "rank"}:
-        raise ValueError("method must be 'pearson' or 'rank'")
+    # Join with returns; both sides are already filtered to usable rows
+    df = alphas.join(rets, on=["date", "barrid"], how="inner")
 
     if m == "pearson":
         ic = (
             df.group_by("date")
               .agg(
-                  pl.len().alias("n"),
                   pl.corr("alpha", "window_return").alias("ic"),
+                  pl.len().alias("n"),
               )
         )
     else:  # rank
         ranked = df.with_columns(
-            pl.col("alpha").rank(method="average").over("date").alias("alpha_r"),
-            pl.col("window_return").rank(method="average").over("date").alias("ret_r"),
+            pl.col("alpha").rank(method=tie_method).over("date").cast(pl.Float64).alias("alpha_r"),
+            pl.col("window_return").rank(method=tie_method).over("date").cast(pl.Float64).alias("ret_r"),
         )
+        # Average and ordinal ranks always have mean (n + 1) / 2, so the Pearson
+        # correlation of ranks reduces to sums of squares. Without ties this is
+        # the textbook 1 - 6 * sum(d^2) / (n (n^2 - 1)); the general form below
+        # stays exact when ties shrink the rank variances.
+        n = pl.len().cast(pl.Float64)
+        n_mean_sq = n * ((n + 1) / 2) ** 2
+        alpha_ss = pl.col("alpha_r").pow(2).sum() - n_mean_sq
+        ret_ss = pl.col("ret_r").pow(2).sum() - n_mean_sq
+        diff_ss = (pl.col("alpha_r") - pl.col("ret_r")).pow(2).sum()
         ic = (
             ranked.group_by("date")
                 .agg(
+                    ((alpha_ss + ret_ss - diff_ss) / 2 / (alpha_ss * ret_ss).sqrt()).alias("ic"),
                     pl.len().alias("n"),
-                    pl.corr("alpha_r", "ret_r").alias("ic"),
                 )
         )
 
-    return ic.select("date", "ic", "n")
\ No newline at end of file
+    return ic.collect(engine="streaming")
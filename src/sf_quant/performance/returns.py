@@ -1,4 +1,8 @@
+import datetime as dt
+from functools import lru_cache
+
 import polars as pl
+from sf_quant.data._tables import assets_table
 from sf_quant.data.assets import load_assets
 from sf_quant.data.benchmark import load_benchmark
 from sf_quant.schema.portfolio_schema import PortfolioSchema
@@ -38,7 +42,9 @@ def generate_multi_returns_from_weights(weights: PortfolioSchema) -> MultiPortfo
 
     Notes
     -----
-    - Asset returns are sourced via ``load_assets``.
+    - Asset returns are sourced via ``load_assets`` and cached for the two
+      most recent date ranges, so repeated calls over the same range skip
+      the read. Cached returns reflect the database as of the first read.
     - Benchmark weights are sourced via ``load_benchmark``.
     - Returns are computed as the weighted sum of returns by portfolio.
 
@@ -73,36 +79,27 @@ def generate_multi_returns_from_weights(weights: PortfolioSchema) -> MultiPortfo
     start = weights["date"].min()
     end = weights["date"].max()
 
-    columns = ["date", "barrid", "return"]
-
-    returns = load_assets(start=start, end=end, in_universe=True, columns=columns)
+    returns = _load_returns(start, end)
 
     benchmark = load_benchmark(start=start, end=end)
 
-    returns = returns.sort("barrid", "date")
-
     joined = (
         weights.join(returns, on=["date", "barrid"], how="left")
         .join(benchmark, on=["date", "barrid"], how="left", suffix="_bmk")
-        .with_columns(
-            pl.col("return").truediv(100),
-        )
-        .with_columns(pl.col("weight").sub("weight_bmk").alias("weight_act"))
-        .rename({"weight": "total", "weight_bmk": "benchmark", "weight_act": "active"})
-        .unpivot(
-            index=["date", "barrid", "return"],
-            variable_name="portfolio",
-            value_name="weight",
-        )
     )
 
-    # Build aggregation expressions
-    agg_exprs = []
-    agg_exprs.append(pl.col("return").mul("weight").sum().alias("return"))
+    # Aggregate each portfolio as its own column instead of unpivoting the
+    # security-level rows, then reshape the small per-date result
+    asset_return = pl.col("return").truediv(100)
 
     result = (
-        joined.group_by("date", "portfolio")
-        .agg(agg_exprs)
+        joined.group_by("date")
+        .agg(
+            asset_return.mul("weight").sum().alias("total"),
+            asset_return.mul("weight_bmk").sum().alias("benchmark"),
+            asset_return.mul(pl.col("weight").sub("weight_bmk")).sum().alias("active"),
+        )
+        .unpivot(index="date", variable_name="portfolio", value_name="return")
         .sort("date", "portfolio")
     )
     return MultiPortfolioRetSchema.validate(result)
@@ -136,7 +133,9 @@ def generate_returns_from_weights(weights: PortfolioSchema) -> PortfolioRetSchem
 
     Notes
     -----
-    - Asset returns are sourced via ``load_assets``.
+    - Asset returns are sourced via ``load_assets`` and cached for the two
+      most recent date ranges, so repeated calls over the same range skip
+      the read. Cached returns reflect the database as of the first read.
     - Returns are computed as the weighted sum of returns by portfolio.
 
     Examples
@@ -166,11 +165,7 @@ def generate_returns_from_weights(weights: PortfolioSchema) -> PortfolioRetSchem
     start = weights["date"].min()
     end = weights["date"].max()
 
-    columns = ["date", "barrid", "return"]
-
-    returns = load_assets(start=start, end=end, in_universe=True, columns=columns)
-
-    returns = returns.sort("barrid", "date")
+    returns = _load_returns(start, end)
 
     joined = (
         weights.join(returns, on=["date", "barrid"], how="left")
@@ -186,4 +181,19 @@ def generate_returns_from_weights(weights: PortfolioSchema) -> PortfolioRetSchem
         ])
         .sort("date")
     )
-    return PortfolioRetSchema.validate(result)
\ No newline at end of file
+    return PortfolioRetSchema.validate(result)
+
+
+def _load_returns(start: dt.date, end: dt.date) -> pl.DataFrame:
+    """Load in-universe asset returns, reusing earlier reads of the same range."""
+    # Callers get their own frame so in-place edits never reach the cache
+    return _cached_returns(start, end, assets_table._base_path).clone()
+
+
+@lru_cache(maxsize=2)
+def _cached_returns(start: dt.date, end: dt.date, base_path: str) -> pl.DataFrame:
+    # base_path keys the cache on the configured database as well as the dates;
+    # each entry is a full return panel, so only keep the latest couple of ranges
+    columns = ["date", "barrid", "return"]
+
+    return load_assets(start=start, end=end, in_universe=True, columns=columns)
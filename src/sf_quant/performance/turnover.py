@@ -2,33 +2,74 @@ import polars as pl
 import polars.selectors as cs
 import matplotlib.pyplot as plt
 
-from sf_quant.performance.leverage import generate_leverage_from_weights
 
+def generate_turnover_from_weights(weights: pl.DataFrame) -> pl.DataFrame:
+    """
+    Compute rolling two-sided portfolio turnover from weights.
+
+    The result can be passed to :func:`get_turnover_stats` and
+    :func:`plot_turnover` in place of the weights, so that turnover is
+    only computed once when both are needed.
+
+    Parameters
+    ----------
+    weights : pl.DataFrame
+        Portfolio weights containing:
+
+        - ``date`` (date): The observation date.
+        - ``barrid`` (str): Security identifier.
+        - ``weight`` (float): Portfolio weight.
 
-def _compute_turnover(weights: pl.DataFrame) -> pl.DataFrame:
-    # Generate leverage from weights
-    leverage = generate_leverage_from_weights(weights)
+    Returns
+    -------
+    pl.DataFrame
+        Turnover by date with columns:
 
+        - ``date`` (date): The observation date.
+        - ``two_sided_turnover`` (float): Rolling 252-day mean of two-sided
+          turnover, null during the warm-up period.
+
+    Notes
+    -----
+    - Two-sided turnover is the sum of absolute weight changes per date,
+      divided by that date's leverage.
+    - Rolling window is 252 trading days.
+
+    Examples
+    --------
+    >>> import sf_quant.performance as sfp
+    >>> turnover = sfp.generate_turnover_from_weights(weights)
+    >>> sfp.get_turnover_stats(turnover)
+    >>> sfp.plot_turnover(turnover, title="Turnover")
+    """
     return (
-        weights.sort("date", "barrid")
-        .with_columns(
-            pl.col("weight")
-            .sub(pl.col("weight").shift(1))
-            .over("barrid")
-            .alias("diff")
-        )
+        weights.lazy()
+        # One sort puts each barrid's history in date order for the diff
+        .sort("barrid", "date")
+        .with_columns(pl.col("weight").diff().over("barrid").alias("diff"))
         .group_by("date")
-        .agg(pl.col("diff").abs().sum().alias("two_sided_turnover"))
+        .agg(
+            pl.col("diff").abs().sum().alias("two_sided_turnover"),
+            # Same leverage as generate_leverage_from_weights, without a second pass
+            pl.col("weight").abs().sum().round(2).alias("leverage"),
+        )
         .sort("date")
-        .join(leverage, on="date")
         .with_columns(
             (pl.col("two_sided_turnover") / pl.col("leverage")).alias("two_sided_turnover")
         )
         .with_columns(pl.col("two_sided_turnover").rolling_mean(252))
         .drop("leverage")
+        .collect()
     )
 
 
+def _as_turnover(data: pl.DataFrame) -> pl.DataFrame:
+    # Accept turnover already produced by generate_turnover_from_weights
+    if "two_sided_turnover" in data.columns:
+        return data
+    return generate_turnover_from_weights(data)
+
+
 def get_turnover_stats(weights: pl.DataFrame) -> pl.DataFrame:
     """
     Compute summary statistics for two-sided portfolio turnover.
@@ -45,6 +86,9 @@ def get_turnover_stats(weights: pl.DataFrame) -> pl.DataFrame:
         - ``barrid`` (str): Security identifier.
         - ``weight`` (float): Portfolio weight.
 
+        Turnover already computed by :func:`generate_turnover_from_weights`
+        is also accepted and used as is.
+
     Returns
     -------
     pl.DataFrame
@@ -80,17 +124,16 @@ def get_turnover_stats(weights: pl.DataFrame) -> pl.DataFrame:
     │ 0.15          ┆ 0.1           ┆ 0.2           │
     └───────────────┴───────────────┴───────────────┘
     """
-    turnover = _compute_turnover(weights)
+    turnover = _as_turnover(weights)
 
-    return (
-        turnover.drop_nulls("two_sided_turnover")
-        .select(
-            pl.col("two_sided_turnover").mean().alias("Mean Turnover"),
-            pl.col("two_sided_turnover").min().alias("Min Turnover"),
-            pl.col("two_sided_turnover").max().alias("Max Turnover"),
-        )
-        .with_columns(cs.float().round(4))
-    )
+    # Mean/min/max already skip nulls, so the warm-up rows need no drop_nulls copy
+    two_sided_turnover = pl.col("two_sided_turnover")
+
+    return turnover.select(
+        two_sided_turnover.mean().alias("Mean Turnover"),
+        two_sided_turnover.min().alias("Min Turnover"),
+        two_sided_turnover.max().alias("Max Turnover"),
+    ).with_columns(cs.float().round(4))
 
 
 def plot_turnover(
@@ -110,6 +153,9 @@ def plot_turnover(
         - ``date`` (date): The observation date.
         - ``barrid`` (str): Security identifier.
         - ``weight`` (float): Portfolio weight.
+
+        Turnover already computed by :func:`generate_turnover_from_weights`
+        is also accepted and used as is.
     title : str
         The chart's main title.
     subtitle : str or None, optional
@@ -127,7 +173,7 @@ def plot_turnover(
     - Two-sided turnover is the sum of absolute weight changes per date.
     - Rolling window is 252 trading days.
     """
-    turnover = _compute_turnover(weights)
+    turnover = _as_turnover(weights)
 
     plt.figure(figsize=(10, 6))
     plt.plot(turnover["date"], turnover["two_sided_turnover"])
@@ -1,7 +1,9 @@
+import numpy as np
 import polars as pl
-import statsmodels.formula.api as smf
+from scipy.linalg import cho_factor, cho_solve
 
 from sf_quant.data import load_fama_french
+from sf_quant.research.quantile_portfolios import _port_cols
 from sf_quant.schema.returns_schema import PortfolioRetSchema
 
 
@@ -34,7 +36,8 @@ def run_ff_regression(
 
     Notes
     -----
-    - Factors are loaded automatically from the date range in portfolio_returns.
+    - Factors are loaded automatically from the date range in portfolio_returns
+      and cached, so repeated calls over the same range skip the read.
     - Returns and factors are scaled to daily percent (×100) before regression.
     - Factor values are lagged by one day (shift(-1)) prior to joining.
 
@@ -71,21 +74,29 @@ def run_ff_regression(
         .with_columns(pl.exclude("date").shift(-1))
     )
 
-    regression_data = (
+    factor_names = ["mkt_rf", "smb", "hml", "rmw", "cma"]
+
+    # Scale, subtract rf and add the intercept in one projection, then drop rows
+    # with a null or NaN return or factor (e.g. the last date after the shift);
+    # is_finite is null for nulls, so the filter drops both
+    data = (
         portfolio_returns.join(ff5, on="date", how="left")
-        .drop_nulls("return")
-        .with_columns(pl.col("return").sub(pl.col("rf")).alias("return_rf"))
-        .with_columns(pl.exclude("date").mul(100))
+        .select(
+            pl.col("return").sub(pl.col("rf")).mul(100).alias("return_rf"),
+            pl.lit(1.0).alias("const"),
+            pl.col(factor_names).mul(100),
+        )
+        .filter(pl.all_horizontal(pl.all().is_finite()))
+        .to_numpy()
     )
 
-    formula = "return_rf ~ mkt_rf + smb + hml + rmw + cma"
-    results = smf.ols(formula, regression_data).fit()
+    coefficients, t_values = _ols(data[:, 1:], data[:, :1])
 
     return pl.DataFrame(
         {
-            "variable": results.params.index.tolist(),
-            "coefficient": results.params.values.tolist(),
-            "tstat": results.tvalues.values.tolist(),
+            "variable": ["Intercept"] + factor_names,
+            "coefficient": coefficients[:, 0],
+            "tstat": t_values[:, 0],
         }
     )
 
@@ -122,7 +133,8 @@ def run_quantile_ff_regression(
 
     Notes
     -----
-    - Fama-French factors are automatically loaded based on date range in portfolio_returns.
+    - Fama-French factors are automatically loaded based on date range in portfolio_returns
+      and cached, so repeated calls over the same range skip the read.
     - Portfolio excess returns are computed as portfolio return minus risk-free rate.
     - Regressions use OLS with intercept.
     - Results are transposed so rows are statistics and columns are portfolios.
@@ -161,61 +173,87 @@ def run_quantile_ff_regression(
     └───────────────┴──────────┴──────────┴──────────┘
     """
 
-    portfolio_names = [col for col in portfolio_returns.columns if col.startswith("p_") or col == "spread"]
+    portfolio_names = _port_cols(portfolio_returns)
     
     # Drop nulls from scaling operations (rolling window warm-up period)
     df = portfolio_returns.drop_nulls(subset=portfolio_names)
 
-    ff_factors = load_fama_french(
-        start=df['date'].min(), 
-        end=df['date'].max()
-    )
+    ff_factors = load_fama_french(start=df['date'].min(), end=df['date'].max())
 
     port = (
         df
             .join(ff_factors, on="date", how="inner")
             .sort("date")
-            .with_columns([
-                (pl.col(name) - pl.col("rf")).alias(name) for name in portfolio_names
-            ])
+            .with_columns(pl.col(portfolio_names).sub(pl.col("rf")))
     )
 
     name_map = {
         "const": "alpha", "mkt_rf": "beta_mkt", "smb": "beta_smb",
         "hml": "beta_hml", "rmw": "beta_rmw", "cma": "beta_cma"
     }
+    factor_names = ["mkt_rf", "smb", "hml", "rmw", "cma"]
+    feature_names = [name_map[f] for f in factor_names + ["const"]]
 
-    results = []
-
-    for p in portfolio_names:
-        res = (
-            port.select(
-                pl.col(p).least_squares.ols(
-                    pl.col('mkt_rf', 'smb', 'hml', 'rmw', 'cma'),
-                    mode='statistics',
-                    add_intercept=True
-                ).alias("stats")
-            )
-            .unnest("stats")
-            .explode("feature_names", "coefficients", "t_values") 
-            .with_columns(
-                pl.col("feature_names").replace(name_map)
-            )
-            .select([
-                pl.col("feature_names"),
-                pl.format("{} ({}){}", 
-                    pl.col("coefficients").round(4), 
-                    pl.col("t_values").round(2),
-                    pl.when(pl.col("t_values").abs() > 2)
-                    .then(pl.lit("*"))
-                    .otherwise(pl.lit(""))
-                ).alias(p)
-            ])
-        )
-        results.append(res)
+    # Every portfolio shares the same design matrix, so solve them all at once;
+    # the intercept is a literal column in the same copy as the factors and targets
+    data = port.select(
+        *factor_names, pl.lit(1.0).alias("const"), *portfolio_names
+    ).to_numpy()
+    n_features = len(feature_names)
+    coefficients, t_values = _ols(data[:, :n_features], data[:, n_features:])
+
+    # Keep results numeric until the end, then format every cell in one select
+    stats = pl.concat(
+        [
+            pl.DataFrame(coefficients, schema=portfolio_names, orient="row"),
+            pl.DataFrame(t_values, schema=[f"t_{p}" for p in portfolio_names], orient="row"),
+        ],
+        how="horizontal",
+    )
+
+    return stats.select(
+        pl.Series("feature_names", feature_names),
+        *[
+            pl.format("{} ({}){}",
+                pl.col(p).round(4),
+                pl.col(f"t_{p}").round(2),
+                pl.when(pl.col(f"t_{p}").abs() > 2)
+                .then(pl.lit("*"))
+                .otherwise(pl.lit(""))
+            ).alias(p)
+            for p in portfolio_names
+        ],
+    )
+
+
+def _ols(X: np.ndarray, Y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Fit ordinary least squares for several targets sharing one design matrix.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Design matrix of shape ``(n, p)``, including any intercept column.
+    Y : np.ndarray
+        Targets of shape ``(n, k)``, one column per regression.
+
+    Returns
+    -------
+    tuple of np.ndarray
+        Coefficients and t-statistics, each of shape ``(p, k)``.
+    """
+    n, p = X.shape
+
+    # X'X is symmetric positive definite, so solve through its Cholesky factor
+    # rather than forming an explicit inverse
+    factor = cho_factor(X.T @ X)
+    coefficients = cho_solve(factor, X.T @ Y)
+
+    residuals = Y - X @ coefficients
+    sigma2 = (residuals * residuals).sum(axis=0) / (n - p)
 
-    final_df = results[0]
-    for other_df in results[1:]:
-        final_df = final_df.join(other_df, on="feature_names", how="left")
+    # Only the diagonal of (X'X)^-1 is needed for the standard errors
+    XtX_inv_diag = np.diag(cho_solve(factor, np.eye(p)))
+    standard_errors = np.sqrt(np.outer(XtX_inv_diag, sigma2))
 
-    return final_df
\ No newline at end of file
+    return coefficients, coefficients / standard_errors
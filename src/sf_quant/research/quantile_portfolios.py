@@ -39,9 +39,15 @@ def generate_quantile_ports(
           vol-scaled and beta-scaled.
         - ``bmk_return`` (float): Benchmark market returns.
 
+    Raises
+    ------
+    ValueError
+        If ties in the signal leave a bin empty on every date.
+
     Notes
     -----
-    - Quantiles are computed within each date using ``qcut``.
+    - Bins are assigned within each date from the signal's rank, so each bin
+      holds an equal share of assets (ties share a bin).
     - Benchmark returns are joined from ``load_benchmark_returns``.
     - Volatility scaling uses a 22-day rolling window with 5% target vol.
     - Beta scaling uses a 60-day rolling window with target beta of 1.0.
@@ -72,20 +78,39 @@ def generate_quantile_ports(
     └────────────┴────────┴────────┴────────┴────────┴────────┴────────┴──────────────┘
     """
 
+    # Integer bin from each signal's rank within its date; ties share the lowest rank
+    rank = pl.col(signal_col).rank(method="min")
+    bin_ = (rank - 1) * num_bins // pl.col(signal_col).count()
+
+    # Narrowest key that holds every bin keeps the group_by and pivot hashing cheap
+    bin_dtype = pl.Int8 if num_bins <= 128 else pl.Int16
+
+    # Bin and average lazily up to the pivot, which needs an eager frame
     df = (
-        signal
-        .with_columns(
-            pl.col(signal_col).qcut(num_bins, labels=[f"p_{i}" for i in range(1, num_bins + 1)]).alias('bin').over('date')
-        )
+        signal.lazy()
+        .select("date", signal_col, "return")
+        .with_columns(bin_.over('date').cast(bin_dtype).alias('bin'))
         .group_by(["date", "bin"])
         .agg(pl.col("return").mean().alias("ew_return"))
         .sort(["date", "bin"])
+        .collect()
         .pivot(index="date", on="bin", values="ew_return")
-        .with_columns((pl.col(f"p_{num_bins}") - pl.col("p_1")).alias("spread"))
+        .rename({str(i): f"p_{i + 1}" for i in range(num_bins)}, strict=False)
     )
 
+    # Heavily tied signals can leave a bin empty on every date
+    missing = [f"p_{i + 1}" for i in range(num_bins) if f"p_{i + 1}" not in df.columns]
+    if missing:
+        raise ValueError(
+            f"No assets fell into {', '.join(missing)}: the signal has too many "
+            f"ties for {num_bins} bins. Use fewer bins or break the ties."
+        )
+
+    df = df.with_columns((pl.col(f"p_{num_bins}") - pl.col("p_1")).alias("spread"))
+
     market_returns = load_benchmark_returns(df['date'].min(), df['date'].max())
     df = df.join(market_returns, on="date", how="left")
+
     df = beta_scale_ports(df, market_col="bmk_return")
     df = vol_scale_ports(df)
 
@@ -143,14 +168,14 @@ def vol_scale_ports(df: pl.DataFrame, target_vol: float = 0.05, window: int = 22
     >>> scaled.columns
     ['date', 'p_1', 'p_10', 'spread']
     """
-    port_cols = [col for col in df.columns if col.startswith("p_") or col == "spread"]
+    port_cols = _port_cols(df)
 
-    return df.with_columns([
-        (
-            pl.col(col) * (target_vol / (pl.col(col).rolling_std(window) * (252 ** 0.5)))
-        ).alias(col)
-        for col in port_cols
-    ])
+    # One expression over every portfolio column rather than one per column
+    ports = pl.col(port_cols)
+
+    return df.with_columns(
+        ports * (target_vol / (ports.rolling_std(window) * (252 ** 0.5)))
+    )
 
 def beta_scale_ports(df: pl.DataFrame, market_col: str = "bmk_return", target_beta: float = 1.0, lookback: int = 60) -> pl.DataFrame:
     """
@@ -213,7 +238,8 @@ def beta_scale_ports(df: pl.DataFrame, market_col: str = "bmk_return", target_be
     ['date', 'p_1', 'p_10', 'spread', 'bmk_return']
     """
 
-    port_cols = [col for col in df.columns if col.startswith("p_")]
+    port_cols = _port_cols(df, include_spread=False)
+
     bmk_var = pl.col(market_col).rolling_var(window_size=lookback)
     return df.with_columns([
         (
@@ -225,4 +251,11 @@ def beta_scale_ports(df: pl.DataFrame, market_col: str = "bmk_return", target_be
             )
         ).alias(col)
         for col in port_cols
-    ])
\ No newline at end of file
+    ])
+
+def _port_cols(df: pl.DataFrame, include_spread: bool = True) -> list[str]:
+    # Quantile portfolio columns (p_1, p_2, ...) and optionally the long-short spread
+    return [
+        col for col in df.columns
+        if col.startswith("p_") or (include_spread and col == "spread")
+    ]
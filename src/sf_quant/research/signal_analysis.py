@@ -68,7 +68,7 @@ def get_signal_distribution(signal: pl.DataFrame, column: str = "signal") -> Non
     >>> sfr.signal_distribution(signal_df, column='signal')
     # Displays a histogram plot of the signal values
     """
-    signal_values = signal.select(column).to_numpy().flatten()
+    signal_values = signal[column].to_numpy()
 
     plt.figure(figsize=(10, 6))
     plt.hist(signal_values, bins=50, color='steelblue', edgecolor='black', alpha=0.7)